@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Benchmark Streamlit rerun time against conversation length.
+
+Runs ``app.py`` headless through Streamlit's ``AppTest`` harness with a
+pre-filled chat history and times a plain rerun (no new question, so no
+LLM calls). Each length is measured twice: with the default chat window
+and with the window widened to the whole history, which is what the app
+rendered before windowing was introduced.
+
+Usage (from the ``skillquest`` directory):
+
+    python benchmarks/chat_rerun.py
+"""
+
+import os
+import statistics
+import time
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+APP_PATH = Path(__file__).resolve().parents[1] / "src" / "skillquest" / "app.py"
+LENGTHS = [10, 50, 100, 200, 500]
+REPEATS = 5
+
+ANSWER = """# Gradient Descent Definition
+## Core Concept
+- An iterative method that follows the negative gradient to minimise a loss
+## Real-World Context
+- Training linear regression and neural networks
+```python
+for step in range(epochs):
+    weights -= lr * grad(weights)
+```
+## Common Misunderstandings
+- It always finds the global minimum
+"""
+
+
+def build_history(length):
+    """Alternate user questions and markdown answers"""
+    return [
+        {"role": "user", "content": f"Question {i}: what is gradient descent?"}
+        if i % 2 == 0 else
+        {"role": "assistant", "content": ANSWER}
+        for i in range(length)
+    ]
+
+
+def time_rerun(length, window=None):
+    """Median wall time (ms) of a rerun over ``length`` past messages"""
+    at = AppTest.from_file(str(APP_PATH), default_timeout=60)
+    at.session_state["chat_history"] = build_history(length)
+    if window is not None:
+        at.session_state["chat_window"] = window
+    at.run()  # first run pays imports and builds the shared tutor via get_tutor()
+    samples = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        at.run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), len(at.chat_message)
+
+
+def main():
+    os.environ.setdefault("MODEL", "llama-3.3-70b-versatile")
+    os.environ.setdefault("GROQ_API_KEY", "benchmark")
+
+    print(f"{'messages':>8} | {'windowed ms':>11} | {'rendered':>8} | {'full ms':>8} | {'rendered':>8}")
+    print("-" * 56)
+    for length in LENGTHS:
+        windowed_ms, windowed_count = time_rerun(length)
+        full_ms, full_count = time_rerun(length, window=length)
+        print(f"{length:>8} | {windowed_ms:>11.1f} | {windowed_count:>8} | {full_ms:>8.1f} | {full_count:>8}")
+
+
+if __name__ == "__main__":
+    main()
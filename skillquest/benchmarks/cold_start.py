@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Report import time and first-request latency for a fresh worker.
+
+Every measurement runs in a new interpreter so nothing is shared between
+rows. "First request" covers everything a worker does before its first
+LLM call (building the tutor and copying the classifier crew); network
+time is excluded so the numbers are comparable without an API key.
+
+Usage (from the ``skillquest`` directory):
+
+    python benchmarks/cold_start.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src" / "skillquest"
+
+IMPORT_MODULES = ["yaml", "streamlit", "langchain_core.messages", "litellm", "crewai", "crew", "main", "app"]
+
+FIRST_REQUEST = """
+import json, time
+import warmup
+timings = {}
+if WARM:
+    timings.update(warmup.warm_up(ping_llm=False))
+start = time.perf_counter()
+tutor = warmup.get_tutor()
+task = tutor.categorize_question()
+from crewai import Crew, Process
+Crew(agents=[task.agent], tasks=[task], process=Process.sequential).copy()
+timings["first_request"] = time.perf_counter() - start
+print(json.dumps(timings))
+"""
+
+
+def run_fresh(code):
+    """Run ``code`` in a new interpreter inside the app folder and return its last stdout line"""
+    env = dict(os.environ)
+    env.setdefault("MODEL", "llama-3.3-70b-versatile")
+    env.setdefault("GROQ_API_KEY", "benchmark")
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=SRC_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return proc.stdout.strip().splitlines()[-1]
+
+
+def import_seconds(module):
+    """Wall time of ``import module`` in a fresh interpreter"""
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    return float(run_fresh(code))
+
+
+def first_request(warm):
+    """Phase timings for the first request, with or without the warm-up bootstrap"""
+    return json.loads(run_fresh(f"WARM = {warm}\n{FIRST_REQUEST}"))
+
+
+def main():
+    print("Import time (fresh interpreter)")
+    for module in IMPORT_MODULES:
+        print(f"  {module:<26}{import_seconds(module) * 1000:>10.1f} ms")
+
+    print("\nFirst-request latency (excluding the LLM round trip)")
+    for label, warm in (("cold worker", False), ("after warm_up()", True)):
+        timings = first_request(warm)
+        bootstrap = sum(v for k, v in timings.items() if k != "first_request")
+        print(
+            f"  {label:<26}{timings['first_request'] * 1000:>10.1f} ms"
+            f"   (bootstrap {bootstrap * 1000:.1f} ms before traffic)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,23 @@
 import sys
 
 # Import necessary modules
+# crewai/litellm are imported lazily (see warmup.py) to keep cold starts fast
 import sys
 import os
 from datetime import datetime
-from crew import PathwayTutor
-from dotenv import load_dotenv
-import litellm
-from crewai import Crew, Process
 import ast
 import streamlit as st
+from warmup import configure_environment, get_tutor
+from faq_store import get_faq_store
+from shared_cache import get_shared_cache
 
 # ---------- Environment Setup ----------
-# # Load environment variables from .env file
-load_dotenv()
-
-# Set API key for Groq API
-os.environ["GROQ_API_KEY"] = os.getenv("GROQ_API_KEY")
-# Configure LiteLLM to drop unnecessary parameters
-litellm.drop_params = True
+# Load environment variables from .env file
+configure_environment()
 # Fetch the model name from environment variables
 MODEL_NAME = os.getenv("MODEL") #LLama 3.3 70B
+# Number of chat messages rendered per page; older ones load on demand
+CHAT_PAGE_SIZE = 20
 
 
 # ---------- Session Management ----------
@@ -62,44 +59,63 @@ def is_followup_relevant(new_question, session):
     return len(overlap) > 0
 
 
+# ---------- Shared Resources ----------
+# get_tutor() returns one PathwayTutor (agents, tasks and LLM client) per process,
+# shared by every browser session; warmup.py can build it before traffic arrives
+def run_crew(task, inputs, **crew_kwargs):
+    """Kick off a private copy of a single-task crew.
+
+    The tutor's agents and tasks are shared across sessions and CrewAI
+    interpolates inputs into them in place, so each request runs on a copy:
+    Crew.copy() builds fresh Agent and Task objects from the shared config
+    and shallow-copies the LLM settings for every request.
+    """
+    from crewai import Crew, Process
+
+    template = Crew(
+        agents=[task.agent],
+        tasks=[task],
+        process=Process.sequential,
+        verbose=True,
+        **crew_kwargs
+    )
+    return template.copy().kickoff(inputs=inputs)
+
+
 def initialize_session_state():
     """Initialize Streamlit session state variables if they don't exist"""
     if 'session_manager' not in st.session_state:
         st.session_state.session_manager = SessionManager()
     if 'current_session' not in st.session_state:
         st.session_state.current_session = st.session_state.session_manager.get_session("default")
-    if 'tutor' not in st.session_state:
-        st.session_state.tutor = PathwayTutor()
     if 'chat_history' not in st.session_state:
         st.session_state.chat_history = []
+    if 'chat_window' not in st.session_state:
+        st.session_state.chat_window = CHAT_PAGE_SIZE
 
 
 # ---------- Processing Logic ----------
-def process_question(user_question):
-    """Categorizes and processes the user question, returns the answer"""
+def answer_question(user_question, history=""):
+    """Categorizes and answers a question with the crew, returns (answer, category)"""
     # Prepare input parameters
     inputs = {
         'question': user_question,
         'current_year': str(datetime.now().year),
         'model': MODEL_NAME,
-        'history': format_history(st.session_state.current_session['history'])
+        'history': history
     }
 
-    # Categorize the question
-    categorize_task = st.session_state.tutor.categorize_question()
-    category_crew = Crew(
-        agents=[st.session_state.tutor.classifier()],
-        tasks=[categorize_task],
-        process=Process.sequential,
-        verbose=True
-    )
-    categorization = category_crew.kickoff(inputs=inputs)
-    category_dict = ast.literal_eval(str(categorization).strip())
-    category = category_dict['category']
+    tutor = get_tutor()
 
-    # Update session's root category and root question
-    st.session_state.current_session['root_category'] = category
-    st.session_state.current_session['root_question'] = user_question
+    # Categorize the question, reusing a classification made by any worker
+    cache = get_shared_cache()
+    category = cache.get_category(user_question, history) if cache is not None else None
+    if category is None:
+        categorization = run_crew(tutor.categorize_question(), inputs)
+        category_dict = ast.literal_eval(str(categorization).strip())
+        category = category_dict['category']
+        if cache is not None:
+            cache.set_category(user_question, history, category)
 
     # Handle irrelevant queries
     if category == "Irrelevant":
@@ -107,35 +123,74 @@ def process_question(user_question):
 
     # Map categories to tasks
     task_mapping = {
-        "Definition-Based": st.session_state.tutor.define_term(),
-        "Concept-Explanation": st.session_state.tutor.explain_concept(),
-        "Types-Examples": st.session_state.tutor.give_types_examples(),
-        "Problem-Solving": st.session_state.tutor.solve_problem(),
-        "Comparison": st.session_state.tutor.compare_concepts(),
-        "Process-Guide": st.session_state.tutor.guide_process(),
-        "Doubt-Clearing": st.session_state.tutor.clear_doubt(),
-        "Python-Code": st.session_state.tutor.provide_python_code(),
-        "Python-Debug": st.session_state.tutor.debug_python_code()
+        "Definition-Based": tutor.define_term(),
+        "Concept-Explanation": tutor.explain_concept(),
+        "Types-Examples": tutor.give_types_examples(),
+        "Problem-Solving": tutor.solve_problem(),
+        "Comparison": tutor.compare_concepts(),
+        "Process-Guide": tutor.guide_process(),
+        "Doubt-Clearing": tutor.clear_doubt(),
+        "Python-Code": tutor.provide_python_code(),
+        "Python-Debug": tutor.debug_python_code()
     }
 
      # Fetch the task for the category
     task = task_mapping.get(category)
     if task:
-        execution_crew = Crew(
-            agents=[task.agent],
-            tasks=[task],
-            process=Process.sequential,
-            verbose=True,
-            full_output=True
-        )
-        result = execution_crew.kickoff(inputs=inputs)
+        result = run_crew(task, inputs, full_output=True)
         return result.raw, category
 
     # Fallback if no matching task found
     return "Unable to process the question.", category
 
 
+def process_question(user_question):
+    """Answers from the FAQ store or shared cache when possible, otherwise runs the crew"""
+    history = format_history(st.session_state.current_session['history'])
+    faq = get_faq_store()
+    cache = get_shared_cache()
+
+    # FAQ answers were built without history, so only fresh questions may use them
+    hit = faq.lookup(user_question) if faq is not None and not history else None
+    if hit is None and cache is not None:
+        hit = cache.get_answer(user_question, history)
+    if hit is not None:
+        answer, category = hit
+    else:
+        answer, category = answer_question(user_question, history)
+        if cache is not None and answer != "Unable to process the question.":
+            cache.set_answer(user_question, history, answer, category)
+    if cache is not None:
+        cache.record_request(cache_hit=hit is not None)
+
+    # Update session's root category and root question
+    st.session_state.current_session['root_category'] = category
+    st.session_state.current_session['root_question'] = user_question
+
+    return answer, category
+
+
 # ---------- Streamlit UI ----------
+def show_earlier_messages():
+    """Widen the rendered chat window by one page"""
+    st.session_state.chat_window += CHAT_PAGE_SIZE
+
+
+@st.fragment
+def render_chat_history():
+    """Render the most recent page of the chat; paging back reruns only this fragment"""
+    history = st.session_state.chat_history
+    start = max(len(history) - st.session_state.chat_window, 0)
+    if start:
+        st.button(
+            f"⬆️ Show earlier messages ({start} hidden)",
+            on_click=show_earlier_messages
+        )
+    for message in history[start:]:
+        with st.chat_message(message["role"]):
+            st.markdown(message["content"])
+
+
 def main():
     st.set_page_config(
         page_title="Skill Quest - AI Learning Companion",
@@ -159,12 +214,11 @@ def main():
                 str(datetime.now())
             )
             st.session_state.chat_history = []
+            st.session_state.chat_window = CHAT_PAGE_SIZE
             st.success("New session started!")
 
     # Display past chat history
-    for message in st.session_state.chat_history:
-        with st.chat_message(message["role"]):
-            st.markdown(message["content"])
+    render_chat_history()
 
     # Capture user input
     user_input = st.chat_input("Ask me about Data Science, ML, or AI...")
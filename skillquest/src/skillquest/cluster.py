@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""Supervised multi-worker deployment on one host.
+
+Starts N warmed Streamlit workers (``warmup.py --serve``) on private ports and
+a front router on the public port. The router gives each browser a
+``sq_session`` cookie and uses rendezvous hashing on it to pick a worker, so
+a session's HTTP requests and its websocket always reach the same process and
+keep its Streamlit state. Sessions stay on their worker while its process is
+alive; only when it exits, or fails several health checks in a row, do its
+own sessions move (losing their state), and the supervisor restarts it. Workers share classifications and answers through
+one SQLite file (see ``shared_cache.py``) and the FAQ store through the page
+cache.
+
+GET /_cluster/health on the router returns JSON with the liveness, health
+check result, restart state, open connections and requests served for each
+worker. A worker that keeps crashing on startup is restarted with exponential
+backoff and reported as failed after a few quick exits.
+
+Usage:
+
+    python cluster.py [--workers N] [--port 8501] [--no-ping]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import secrets
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from shared_cache import SharedCache
+
+SRC_DIR = Path(__file__).resolve().parent
+SESSION_COOKIE = "sq_session"
+HEALTH_PATH = "/_cluster/health"
+HEALTH_INTERVAL = 5  # seconds between worker health checks
+MAX_FAILED_PROBES = 3  # consecutive failed checks before a live worker loses its sessions
+QUICK_EXIT_SECONDS = 60  # a worker that dies sooner than this counts as a crash loop
+MAX_QUICK_RESTARTS = 5  # then it is marked failed and left down
+BACKOFF_BASE = 2  # seconds before the first restart, doubled after each quick exit
+BACKOFF_MAX = 120
+MAX_HEADER_BYTES = 64 * 1024
+PIPE_CHUNK = 64 * 1024
+
+
+class Worker:
+    """One Streamlit process and the router's bookkeeping for it"""
+
+    def __init__(self, index, port, env, ping_llm):
+        self.index = index
+        self.port = port
+        self.env = env
+        self.ping_llm = ping_llm
+        self.process = None
+        self.restarts = 0
+        self.quick_exits = 0
+        self.next_start = None
+        self.failed = False
+        self.healthy = False
+        self.failed_probes = 0
+        self.active_connections = 0
+        self.total_connections = 0
+        self.started = None
+
+    def start(self):
+        env = dict(self.env)
+        env.update({
+            "STREAMLIT_SERVER_PORT": str(self.port),
+            "STREAMLIT_SERVER_ADDRESS": "127.0.0.1",
+            "STREAMLIT_SERVER_HEADLESS": "true",
+            "STREAMLIT_BROWSER_GATHER_USAGE_STATS": "false",
+            "SKILLQUEST_WORKER_ID": str(self.index),
+        })
+        args = [sys.executable, "warmup.py", "--serve"]
+        if not self.ping_llm:
+            args.append("--no-ping")
+        self.process = subprocess.Popen(args, cwd=SRC_DIR, env=env)
+        self.started = time.time()
+        self.healthy = False
+        self.failed_probes = 0
+
+    @property
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def stop(self):
+        if self.alive:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+
+class Supervisor:
+    """Keeps the workers running and chooses one for each session"""
+
+    def __init__(self, workers, cache):
+        self.workers = workers
+        self.cache = cache
+
+    def pick(self, session_id):
+        """Rendezvous hash over live, healthy workers so sessions stay put"""
+        candidates = [w for w in self.workers if w.alive and w.healthy]
+        if not candidates:
+            return None
+        return max(
+            candidates,
+            key=lambda w: hashlib.blake2b(f"{session_id}:{w.index}".encode(), digest_size=8).digest(),
+        )
+
+    async def check(self, worker):
+        """Ask Streamlit's own health endpoint whether the worker is serving"""
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection("127.0.0.1", worker.port), timeout=2
+            )
+            writer.write(b"GET /_stcore/health HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n")
+            await writer.drain()
+            status = await asyncio.wait_for(reader.readline(), timeout=2)
+            writer.close()
+            return b" 200 " in status
+        except (OSError, asyncio.TimeoutError):
+            return False
+
+    def record_probe(self, worker, ok):
+        """Update routing health from one check; a live worker survives isolated failures"""
+        if ok:
+            worker.failed_probes = 0
+            worker.healthy = True
+            return
+        worker.failed_probes += 1
+        # Moving a session loses its Streamlit state, so ride out a slow or missed check
+        if not worker.alive or worker.failed_probes >= MAX_FAILED_PROBES:
+            worker.healthy = False
+
+    def supervise(self, worker, now):
+        """Restart a dead worker with exponential backoff; give up after a crash loop"""
+        if worker.failed or worker.process is None or worker.alive:
+            return
+        if worker.next_start is None:
+            if now - worker.started < QUICK_EXIT_SECONDS:
+                worker.quick_exits += 1
+            else:
+                worker.quick_exits = 0
+            if worker.quick_exits >= MAX_QUICK_RESTARTS:
+                worker.failed = True
+                print(f"❌ Worker {worker.index} exited {worker.quick_exits} times in a row "
+                      f"within {QUICK_EXIT_SECONDS}s; marking it failed")
+                return
+            delay = min(BACKOFF_BASE * 2 ** max(worker.quick_exits - 1, 0), BACKOFF_MAX)
+            worker.next_start = now + delay
+            print(f"⚠️ Worker {worker.index} exited ({worker.process.returncode}); restarting in {delay}s")
+        if now >= worker.next_start:
+            worker.next_start = None
+            worker.restarts += 1
+            worker.start()
+
+    async def monitor(self):
+        while True:
+            for worker in self.workers:
+                self.supervise(worker, time.time())
+                self.record_probe(worker, worker.alive and await self.check(worker))
+            await asyncio.sleep(HEALTH_INTERVAL)
+
+    def report(self):
+        stats = self.cache.worker_stats()
+        return {
+            "workers": [
+                {
+                    "worker": w.index,
+                    "port": w.port,
+                    "pid": w.process.pid if w.process else None,
+                    "alive": w.alive,
+                    "healthy": w.healthy,
+                    "failed_probes": w.failed_probes,
+                    "failed": w.failed,
+                    "restarts": w.restarts,
+                    "next_restart_in": round(w.next_start - time.time(), 1) if w.next_start else None,
+                    "uptime": round(time.time() - w.started, 1) if w.started else None,
+                    "active_connections": w.active_connections,
+                    "total_connections": w.total_connections,
+                    "requests": stats.get(str(w.index), {}).get("requests", 0),
+                    "cache_hits": stats.get(str(w.index), {}).get("cache_hits", 0),
+                    "last_request": stats.get(str(w.index), {}).get("last_request"),
+                }
+                for w in self.workers
+            ]
+        }
+
+
+def session_from_headers(header_lines):
+    """Return the sq_session cookie value, if the client sent one"""
+    for line in header_lines:
+        name, _, value = line.partition(":")
+        if name.strip().lower() != "cookie":
+            continue
+        for cookie in value.split(";"):
+            key, _, cookie_value = cookie.strip().partition("=")
+            if key == SESSION_COOKIE and cookie_value:
+                return cookie_value
+    return None
+
+
+async def send_simple(writer, status, body, content_type="application/json"):
+    payload = body.encode("utf-8")
+    writer.write(
+        f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+        f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n".encode() + payload
+    )
+    await writer.drain()
+    writer.close()
+
+
+async def pipe(reader, writer, set_cookie=None):
+    """Copy bytes one way; optionally add a Set-Cookie header to the first response"""
+    try:
+        if set_cookie:
+            head = await reader.readuntil(b"\r\n\r\n")
+            writer.write(head[:-2] + set_cookie.encode() + b"\r\n")
+        while True:
+            chunk = await reader.read(PIPE_CHUNK)
+            if not chunk:
+                break
+            writer.write(chunk)
+            await writer.drain()
+    except (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+        pass
+    finally:
+        writer.close()
+
+
+class Router:
+    """Raw TCP proxy that reads only the first request head to route a connection"""
+
+    def __init__(self, supervisor):
+        self.supervisor = supervisor
+
+    async def handle(self, client_reader, client_writer):
+        try:
+            head = await client_reader.readuntil(b"\r\n\r\n")
+        except (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            client_writer.close()
+            return
+
+        request_line, *header_lines = head.decode("latin-1").split("\r\n")
+        path = request_line.split(" ")[1] if request_line.count(" ") >= 2 else "/"
+        if path.startswith(HEALTH_PATH):
+            await send_simple(client_writer, "200 OK", json.dumps(self.supervisor.report(), indent=2))
+            return
+
+        session_id = session_from_headers(header_lines)
+        set_cookie = None
+        if session_id is None:
+            session_id = secrets.token_hex(16)
+            set_cookie = f"Set-Cookie: {SESSION_COOKIE}={session_id}; Path=/; HttpOnly; SameSite=Lax\r\n"
+
+        worker = self.supervisor.pick(session_id)
+        if worker is None:
+            await send_simple(client_writer, "503 Service Unavailable", "No healthy workers yet.", "text/plain")
+            return
+
+        try:
+            upstream_reader, upstream_writer = await asyncio.open_connection("127.0.0.1", worker.port)
+        except OSError:
+            self.supervisor.record_probe(worker, False)
+            await send_simple(client_writer, "502 Bad Gateway", "Worker unavailable.", "text/plain")
+            return
+
+        worker.active_connections += 1
+        worker.total_connections += 1
+        try:
+            upstream_writer.write(head)
+            await asyncio.gather(
+                pipe(client_reader, upstream_writer),
+                pipe(upstream_reader, client_writer, set_cookie),
+            )
+        finally:
+            worker.active_connections -= 1
+
+
+async def serve(args):
+    # Default to a fresh per-run database so separate clusters never mix caches or counters
+    run_dir = None if args.cache else tempfile.mkdtemp(prefix="skillquest_cluster_")
+    cache_path = args.cache or os.path.join(run_dir, "cache.sqlite3")
+    env = dict(os.environ)
+    env["SKILLQUEST_SHARED_CACHE"] = cache_path
+    # Same cookie secret everywhere so a restarted worker accepts existing XSRF cookies
+    env.setdefault("STREAMLIT_SERVER_COOKIE_SECRET", secrets.token_hex(32))
+
+    workers = [
+        Worker(index, args.worker_port + index, env, ping_llm=not args.no_ping)
+        for index in range(args.workers)
+    ]
+    cache = SharedCache(cache_path)
+    cache.reset_worker_stats()
+    supervisor = Supervisor(workers, cache)
+
+    # Bind the public port before spawning workers so a busy port leaves no orphans
+    router = Router(supervisor)
+    server = await asyncio.start_server(router.handle, args.host, args.port, limit=MAX_HEADER_BYTES)
+    for worker in workers:
+        worker.start()
+    print(f"🚦 Router on http://{args.host}:{args.port} -> {args.workers} workers "
+          f"(ports {args.worker_port}-{args.worker_port + args.workers - 1}), cache {cache_path}")
+
+    loop = asyncio.get_running_loop()
+    stop = loop.create_future()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, lambda: stop.done() or stop.set_result(None))
+
+    monitor = asyncio.create_task(supervisor.monitor())
+    try:
+        await stop
+    finally:
+        monitor.cancel()
+        server.close()
+        for worker in workers:
+            worker.stop()
+        if run_dir:
+            shutil.rmtree(run_dir, ignore_errors=True)
+        print("\n👋 Cluster stopped.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run SkillQuest as a supervised multi-worker cluster")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8501)
+    parser.add_argument("--worker-port", type=int, default=8600, help="first private worker port")
+    parser.add_argument("--cache", help="SQLite file shared by workers (default: a temporary file per run)")
+    parser.add_argument("--no-ping", action="store_true", help="skip the LLM warm-up ping in workers")
+    asyncio.run(serve(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai import LLM
 from memory import PathwayMemory
+from tools.custom_tool import PythonCheckTool
 from pydantic import BaseModel, ConfigDict, Field
 import yaml
 from dotenv import load_dotenv
@@ -44,27 +45,29 @@ class PathwayTutor:
         self.config = PathwayTutorConfig()
         self._configure_paths()
         self.memory = PathwayMemory()
+        # Parse agent YAML and build the LLM client once; every agent shares them
+        with open(self.agents_config_path) as f:
+            self.agents_yaml = yaml.safe_load(f)
+        self.llm = LLM(  # Use CrewAI's native LLM routed via LiteLLM to Groq
+            model=f"groq/{os.getenv('MODEL')}",
+            api_key=os.getenv("GROQ_API_KEY"),
+            temperature=0.3,
+            max_tokens=2048,
+        )
 
     def _configure_paths(self):
         """Set full paths to agent and task configuration YAMLs."""
         self.agents_config_path = self.config.base_directory / self.config.agents_config
         self.tasks_config_path = self.config.base_directory / self.config.tasks_config
 
-    def _create_agent(self, config_name):
+    def _create_agent(self, config_name, tools=None):
         """Create an Agent instance using configuration from YAML file."""
-        with open(self.agents_config_path) as f:
-            config = yaml.safe_load(f)
-
         return Agent(
-            config=config[config_name],
+            config=self.agents_yaml[config_name],
             verbose=True,
             memory=self.memory,  # Attach memory module
-            llm=LLM(  # Use CrewAI's native LLM routed via LiteLLM to Groq
-                model=f"groq/{os.getenv('MODEL')}",
-                api_key=os.getenv("GROQ_API_KEY"),
-                temperature=0.3,
-                max_tokens=2048,
-            ),
+            llm=self.llm,
+            tools=tools or [],
             allow_delegation=False,
             max_iter=5
         )
@@ -113,12 +116,12 @@ class PathwayTutor:
     @agent
     def python_code(self) -> Agent:
         """Agent to generate Python code."""
-        return self._create_agent('python_code')
+        return self._create_agent('python_code', tools=[PythonCheckTool()])
 
     @agent
     def python_debug(self) -> Agent:
         """Agent to debug Python code."""
-        return self._create_agent('python_debug')
+        return self._create_agent('python_debug', tools=[PythonCheckTool()])
 
     # === Task creation methods ===
     @task
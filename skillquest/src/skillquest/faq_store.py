@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""Precomputed FAQ answers in a read-only, memory-mapped store.
+
+The store is one file built offline by running the crew over a curated topic
+list. Workers map it read-only, so every process on a host shares the same
+pages through the OS page cache and top questions are answered with zero LLM
+calls.
+
+File layout (little-endian):
+
+    header   magic (8s) | record count (I) | index offset (Q)
+    records  normalized question \\0 category \\0 answer   (UTF-8, back to back)
+    index    count x (question hash (Q) | record offset (Q) | record length (I)),
+             sorted by hash so lookups are a binary search over the mapping
+
+Usage:
+
+    python faq_store.py build [topics.txt] [faq.bin]
+    python faq_store.py lookup "What is overfitting?"
+"""
+
+import argparse
+import hashlib
+import mmap
+import os
+import re
+import struct
+import sys
+import threading
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+KNOWLEDGE_DIR = Path(__file__).resolve().parents[2] / "knowledge"
+DEFAULT_TOPICS_PATH = KNOWLEDGE_DIR / "faq_topics.txt"
+DEFAULT_STORE_NAME = "faq.bin"
+
+MAGIC = b"SQFAQ001"
+HEADER = struct.Struct("<8sIQ")
+INDEX_ENTRY = struct.Struct("<QQI")
+
+_store = None
+_store_failed = False
+_store_lock = threading.Lock()
+
+
+def store_path():
+    """Store location; read at call time so SKILLQUEST_FAQ_PATH from .env is honoured"""
+    return Path(os.getenv("SKILLQUEST_FAQ_PATH", KNOWLEDGE_DIR / DEFAULT_STORE_NAME))
+
+
+def normalize_question(question):
+    """Lower-case, drop punctuation and collapse whitespace so trivial variants share a key"""
+    return " ".join(re.sub(r"[^\w\s+#-]", " ", question.lower()).split())
+
+
+def question_hash(normalized):
+    """64-bit key for a normalized question"""
+    return int.from_bytes(hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class FAQStore:
+    """Read-only view over a built FAQ file"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mm) < HEADER.size:
+            self._mm.close()
+            raise ValueError(f"{self.path} is too short to be a SkillQuest FAQ store")
+        magic, self.count, self._index_offset = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or self._index_offset + self.count * INDEX_ENTRY.size > len(self._mm):
+            self._mm.close()
+            raise ValueError(f"{self.path} is not a SkillQuest FAQ store")
+
+    def __len__(self):
+        return self.count
+
+    def _entry(self, position):
+        return INDEX_ENTRY.unpack_from(self._mm, self._index_offset + position * INDEX_ENTRY.size)
+
+    def lookup(self, question):
+        """Return (answer, category) for a stored question, or None"""
+        normalized = normalize_question(question)
+        key = question_hash(normalized)
+
+        # Leftmost binary search over the sorted hash index
+        low, high = 0, self.count
+        while low < high:
+            mid = (low + high) // 2
+            if self._entry(mid)[0] < key:
+                low = mid + 1
+            else:
+                high = mid
+
+        # Walk equal hashes and compare the stored question to rule out collisions
+        while low < self.count:
+            entry_key, offset, length = self._entry(low)
+            if entry_key != key:
+                break
+            stored, category, answer = self._mm[offset:offset + length].decode("utf-8").split("\0", 2)
+            if stored == normalized:
+                return answer, category
+            low += 1
+        return None
+
+    def close(self):
+        self._mm.close()
+
+
+def write_store(entries, path):
+    """Write (question, category, answer) entries; replaces the file atomically"""
+    path = Path(path)
+    records = {}
+    for question, category, answer in entries:
+        normalized = normalize_question(question)
+        records[normalized] = "\0".join((normalized, category, answer)).encode("utf-8")
+
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    index = []
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, 0, 0))
+        for normalized, blob in records.items():
+            index.append((question_hash(normalized), f.tell(), len(blob)))
+            f.write(blob)
+        index_offset = f.tell()
+        for entry in sorted(index):
+            f.write(INDEX_ENTRY.pack(*entry))
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, len(index), index_offset))
+
+    # Workers that already mapped the old file keep reading it until they reopen
+    os.replace(tmp_path, path)
+    return len(index)
+
+
+def load_topics(path):
+    """Read one question per line, skipping blanks and # comments"""
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+
+
+def get_faq_store():
+    """Return the process-wide FAQ store, or None if it is missing or unreadable"""
+    global _store, _store_failed
+    if _store is None and not _store_failed:
+        path = store_path()
+        if path.exists():
+            with _store_lock:
+                if _store is None and not _store_failed:
+                    try:
+                        _store = FAQStore(path)
+                    except (OSError, ValueError) as e:
+                        # Serve from the crew instead; warn once rather than on every request
+                        _store_failed = True
+                        print(f"⚠️ Ignoring FAQ store {path}: {e}")
+    return _store
+
+
+def build(topics_path, output_path):
+    """Answer every curated topic with the crew and write the store"""
+    # Reuse the serving pipeline so stored answers match live ones
+    from app import answer_question
+
+    entries = []
+    topics = load_topics(topics_path)
+    for number, question in enumerate(topics, start=1):
+        print(f"[{number}/{len(topics)}] {question}")
+        try:
+            answer, category = answer_question(question)
+        except Exception as e:
+            print(f"  ⚠️ skipped: {e}")
+            continue
+        if category == "Irrelevant" or answer == "Unable to process the question.":
+            print(f"  ⚠️ skipped: category {category}")
+            continue
+        entries.append((question, category, answer))
+
+    count = write_store(entries, output_path)
+    print(f"\n✅ Wrote {count} answers to {output_path}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or query the precomputed FAQ store")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build_cmd = commands.add_parser("build", help="answer the curated topics and write the store")
+    build_cmd.add_argument("topics", nargs="?", default=DEFAULT_TOPICS_PATH)
+    build_cmd.add_argument("output", nargs="?")
+
+    lookup_cmd = commands.add_parser("lookup", help="print the stored answer for a question")
+    lookup_cmd.add_argument("question")
+    lookup_cmd.add_argument("--store")
+
+    args = parser.parse_args(argv)
+    load_dotenv()
+    if args.command == "build":
+        build(args.topics, args.output or store_path())
+        return 0
+
+    hit = FAQStore(args.store or store_path()).lookup(args.question)
+    if hit is None:
+        print("No stored answer.")
+        return 1
+    answer, category = hit
+    print(f"🧠 CATEGORY: {category}\n{answer}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,11 @@
 #!/usr/bin/env python3
 
 from datetime import datetime
-from crew import PathwayTutor
-from dotenv import load_dotenv
+from warmup import configure_environment, get_tutor
 import os
-import litellm
-from crewai import Crew, Process
 import ast
-# Load environment variables
-load_dotenv()
-
-# Configure LiteLLM for Groq
-os.environ["GROQ_API_KEY"] = os.getenv("GROQ_API_KEY")  # Map Groq key to OpenAI key name
-litellm.drop_params = True
+# Load environment variables (crewai/litellm load lazily)
+configure_environment()
 MODEL_NAME = os.getenv("MODEL")
 
 class SessionManager:
@@ -80,7 +73,9 @@ def format_history(history):
     ][-3:])  # Last 3 relevant exchanges
 
 def run():
-    tutor = PathwayTutor()  
+    from crewai import Crew, Process
+
+    tutor = get_tutor()
     sessions = SessionManager()
     current_session = sessions.get_session("default")  # Simplified single session
 
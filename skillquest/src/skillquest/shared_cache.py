@@ -0,0 +1,152 @@
+"""Cross-process caches for multi-worker deployments, backed by SQLite.
+
+Every worker on a host opens the same database file (WAL mode, so readers
+never block the writer) to share question classifications and full answers,
+and to record how many requests it has served for the cluster health report.
+The cache is only active when ``SKILLQUEST_SHARED_CACHE`` points at a database
+path; ``cluster.py`` sets it for the workers it launches.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from faq_store import normalize_question
+
+DEFAULT_CACHE_TTL = 24 * 60 * 60  # seconds
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE TABLE IF NOT EXISTS worker_stats (
+    worker TEXT PRIMARY KEY,
+    pid INTEGER NOT NULL,
+    requests INTEGER NOT NULL DEFAULT 0,
+    cache_hits INTEGER NOT NULL DEFAULT 0,
+    last_request REAL
+);
+"""
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def cache_path():
+    """Database location, or None; read at call time so .env settings are honoured"""
+    return os.getenv("SKILLQUEST_SHARED_CACHE")
+
+
+def cache_ttl():
+    """Entry lifetime in seconds, from SKILLQUEST_CACHE_TTL"""
+    return int(os.getenv("SKILLQUEST_CACHE_TTL", DEFAULT_CACHE_TTL))
+
+
+def worker_id():
+    """Id this process reports its requests under; cluster.py sets it per worker"""
+    return os.getenv("SKILLQUEST_WORKER_ID", str(os.getpid()))
+
+
+def cache_key(*parts):
+    """Stable key for a question plus any context that changes its answer"""
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+class SharedCache:
+    """Key/value cache and worker counters in one SQLite file"""
+
+    def __init__(self, path, ttl=None):
+        self.path = path
+        self.ttl = cache_ttl() if ttl is None else ttl
+        self._local = threading.local()
+        self._connect().executescript(SCHEMA)
+
+    def _connect(self):
+        """One connection per thread; Streamlit serves sessions on many threads"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, namespace, key):
+        """Return the cached JSON value, or None if missing or expired"""
+        row = self._connect().execute(
+            "SELECT value, created FROM cache WHERE namespace = ? AND key = ?",
+            (namespace, key),
+        ).fetchone()
+        if row is None or time.time() - row[1] > self.ttl:
+            return None
+        return json.loads(row[0])
+
+    def set(self, namespace, key, value):
+        self._connect().execute(
+            "INSERT OR REPLACE INTO cache (namespace, key, value, created) VALUES (?, ?, ?, ?)",
+            (namespace, key, json.dumps(value), time.time()),
+        )
+
+    # === Question-level helpers used by the serving path ===
+    def get_category(self, question, history):
+        """Cached classification; the classifier prompt includes history, so the key does too"""
+        return self.get("category", cache_key(normalize_question(question), history))
+
+    def set_category(self, question, history, category):
+        self.set("category", cache_key(normalize_question(question), history), category)
+
+    def get_answer(self, question, history):
+        """Cached (answer, category) for this question in this conversation context"""
+        value = self.get("answer", cache_key(normalize_question(question), history))
+        return tuple(value) if value is not None else None
+
+    def set_answer(self, question, history, answer, category):
+        self.set("answer", cache_key(normalize_question(question), history), [answer, category])
+
+    # === Load reporting ===
+    def record_request(self, cache_hit=False, worker=None):
+        self._connect().execute(
+            """
+            INSERT INTO worker_stats (worker, pid, requests, cache_hits, last_request)
+            VALUES (?, ?, 1, ?, ?)
+            ON CONFLICT(worker) DO UPDATE SET
+                pid = excluded.pid,
+                requests = requests + 1,
+                cache_hits = cache_hits + excluded.cache_hits,
+                last_request = excluded.last_request
+            """,
+            (worker or worker_id(), os.getpid(), int(cache_hit), time.time()),
+        )
+
+    def reset_worker_stats(self):
+        """Forget counters from earlier runs that used the same database"""
+        self._connect().execute("DELETE FROM worker_stats")
+
+    def worker_stats(self):
+        """Per-worker counters keyed by worker id"""
+        rows = self._connect().execute(
+            "SELECT worker, pid, requests, cache_hits, last_request FROM worker_stats"
+        ).fetchall()
+        return {
+            worker: {"pid": pid, "requests": requests, "cache_hits": hits, "last_request": last}
+            for worker, pid, requests, hits, last in rows
+        }
+
+
+def get_shared_cache():
+    """Return the process-wide shared cache, or None when running single-process"""
+    global _cache
+    if _cache is None:
+        path = cache_path()
+        if path:
+            with _cache_lock:
+                if _cache is None:
+                    _cache = SharedCache(path)
+    return _cache
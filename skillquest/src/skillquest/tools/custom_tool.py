@@ -1,19 +1,390 @@
 from crewai.tools import BaseTool
-from typing import Type
+from typing import Type, List, Tuple
 from pydantic import BaseModel, Field
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import ast
+import builtins
+import hashlib
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
 
+try:
+    import resource  # POSIX only; required for sandboxed execution
+except ImportError:
+    resource = None
 
-class MyCustomToolInput(BaseModel):
-    """Input schema for MyCustomTool."""
-    argument: str = Field(..., description="Description of the argument.")
+# Static reports are memoized by the SHA-256 of the submitted code
+CHECK_CACHE_SIZE = 256
 
-class MyCustomTool(BaseTool):
-    name: str = "Name of my tool"
+# Sandboxed execution is opt-in because it runs user-supplied code on this host
+SANDBOX_ENABLED = os.getenv("SKILLQUEST_SANDBOX_EXEC", "0") == "1"
+SANDBOX_WORKERS = 2
+SANDBOX_TIMEOUT = 5  # wall-clock seconds
+SANDBOX_CPU_SECONDS = 2
+SANDBOX_MEMORY_BYTES = 256 * 1024 * 1024
+SANDBOX_OUTPUT_CHARS = 2000
+
+BUILTIN_NAMES = frozenset(dir(builtins)) | {"__file__", "__builtins__"}
+# Third-party packages students routinely import; never reported as unknown
+KNOWN_THIRD_PARTY_MODULES = frozenset({
+    "numpy", "pandas", "scipy", "sklearn", "statsmodels", "matplotlib", "seaborn", "plotly",
+    "torch", "torchvision", "torchaudio", "tensorflow", "keras", "jax", "flax", "xgboost",
+    "lightgbm", "catboost", "transformers", "datasets", "tokenizers", "sentence_transformers",
+    "nltk", "spacy", "gensim", "cv2", "PIL", "skimage", "sympy", "networkx", "joblib", "tqdm",
+    "requests", "bs4", "yaml", "pydantic", "dotenv", "openai", "langchain", "langchain_core",
+    "crewai", "litellm", "streamlit", "gradio", "flask", "fastapi", "pytest", "IPython",
+    "polars", "pyarrow", "dask", "pyspark", "mlflow", "wandb", "optuna", "shap", "imblearn",
+})
+
+KNOWN_MODULES = frozenset(sys.stdlib_module_names) | KNOWN_THIRD_PARTY_MODULES
+# Only near misses of reasonably long names are reported as typos: one edit
+# (a transposition counts as one) below MODULE_TYPO_LONG_NAME characters, two above
+MODULE_TYPO_MIN_LENGTH = 5
+MODULE_TYPO_LONG_NAME = 8
+
+# Lower-case builtins worth warning about when user code rebinds them
+SHADOWABLE_BUILTINS = frozenset(
+    name for name in dir(builtins) if name.islower() and not name.startswith("_")
+)
+
+# Runs inside the child interpreter: apply limits, then execute the snippet from stdin.
+# These are resource limits, not an isolation boundary: the snippet still runs as
+# this user with network and filesystem access. RLIMIT_NPROC blocks fork() for
+# non-root users only.
+SANDBOX_LAUNCHER = """
+import resource, sys
+cpu, mem = int(sys.argv[1]), int(sys.argv[2])
+source = sys.stdin.read()
+resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu))
+resource.setrlimit(resource.RLIMIT_AS, (mem, mem))
+resource.setrlimit(resource.RLIMIT_FSIZE, (0, 0))
+resource.setrlimit(resource.RLIMIT_NPROC, (0, 0))
+exec(compile(source, "<snippet>", "exec"), {"__name__": "__main__"})
+"""
+
+_check_cache = OrderedDict()
+_check_cache_lock = threading.Lock()
+_sandbox_pool = ThreadPoolExecutor(max_workers=SANDBOX_WORKERS, thread_name_prefix="python-sandbox")
+
+Diagnostic = Tuple[int, int, str, str]  # (line, column, rule, message)
+
+
+def _bound_names(tree):
+    """Collect every name the module binds anywhere (flat, scope-insensitive)"""
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, (ast.Store, ast.Del)):
+            names.add(node.id)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.add(node.name)
+        elif isinstance(node, ast.arg):
+            names.add(node.arg)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                names.add(alias.asname or alias.name.split(".")[0])
+        elif isinstance(node, ast.ExceptHandler) and node.name:
+            names.add(node.name)
+        elif isinstance(node, (ast.Global, ast.Nonlocal)):
+            names.update(node.names)
+        elif isinstance(node, (ast.MatchAs, ast.MatchStar)) and node.name:
+            names.add(node.name)
+        elif isinstance(node, ast.MatchMapping) and node.rest:
+            names.add(node.rest)
+    return names
+
+
+@lru_cache(maxsize=512)
+def _module_suggestion(name):
+    """Closest stdlib or well-known package name if ``name`` looks like a typo of one.
+
+    Whether a module is installed on the serving host says nothing about the
+    student's machine, so unknown names are only reported when they are a near
+    miss of a name we do know.
+    """
+    if name in KNOWN_MODULES or len(name) < MODULE_TYPO_MIN_LENGTH:
+        return None
+    max_distance = 2 if len(name) >= MODULE_TYPO_LONG_NAME else 1
+    best = None
+    for known in KNOWN_MODULES:
+        if abs(len(known) - len(name)) > max_distance:
+            continue
+        # Extensions and containment are real, different modules, not typos:
+        # tensorflow_hub / pandas_ta extend a known name, config sits inside sysconfig
+        if known in name or name in known:
+            continue
+        distance = _edit_distance(name, known)
+        if distance <= max_distance and (best is None or (distance, known) < best):
+            best = (distance, known)
+    return best[1] if best else None
+
+
+def _edit_distance(a, b):
+    """Damerau-Levenshtein (optimal string alignment) distance"""
+    previous2, previous = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        previous2, previous = previous, current
+    return previous[len(b)]
+
+
+def _check_names(tree) -> List[Diagnostic]:
+    """Report names that are loaded but never bound or built in"""
+    if any(
+        isinstance(node, ast.ImportFrom) and any(alias.name == "*" for alias in node.names)
+        for node in ast.walk(tree)
+    ):
+        return []  # star imports make symbol resolution unreliable
+
+    known = _bound_names(tree) | BUILTIN_NAMES
+    seen = set()
+    diagnostics = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
+            if node.id not in known and node.id not in seen:
+                seen.add(node.id)
+                diagnostics.append((node.lineno, node.col_offset, "undefined-name",
+                                    f"'{node.id}' is not defined"))
+    return diagnostics
+
+
+def _check_imports(tree) -> List[Diagnostic]:
+    """Report likely misspelled module names and imports that are never used"""
+    loaded = {
+        node.id for node in ast.walk(tree)
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load)
+    }
+    diagnostics = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            modules = [node.module]
+        else:
+            continue
+
+        for module in modules:
+            top = module.split(".")[0]
+            suggestion = _module_suggestion(top)
+            if suggestion:
+                diagnostics.append((node.lineno, node.col_offset, "module-typo",
+                                    f"'{top}' is not a known module name; did you mean '{suggestion}'?"))
+
+        if isinstance(node, ast.ImportFrom) and node.module == "__future__":
+            continue
+        for alias in node.names:
+            bound = alias.asname or alias.name.split(".")[0]
+            if alias.name != "*" and bound not in loaded:
+                diagnostics.append((node.lineno, node.col_offset, "unused-import",
+                                    f"'{alias.name}' is imported but never used"))
+    return diagnostics
+
+
+def _is_mutable_default(node):
+    """True for list/dict/set literals and bare list()/dict()/set() calls"""
+    if isinstance(node, (ast.List, ast.Dict, ast.Set)):
+        return True
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id in ("list", "dict", "set")
+    )
+
+
+def _check_lint(tree) -> List[Diagnostic]:
+    """Common-bug rules that beginners hit in data science code"""
+    diagnostics = []
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            defaults = node.args.defaults + [d for d in node.args.kw_defaults if d is not None]
+            for default in defaults:
+                if _is_mutable_default(default):
+                    diagnostics.append((default.lineno, default.col_offset, "mutable-default",
+                                        f"mutable default argument in '{node.name}' is shared between calls"))
+
+        elif isinstance(node, ast.ExceptHandler) and node.type is None:
+            diagnostics.append((node.lineno, node.col_offset, "bare-except",
+                                "bare 'except:' also catches KeyboardInterrupt and SystemExit"))
+
+        elif isinstance(node, ast.Compare):
+            for op, right in zip(node.ops, node.comparators):
+                if not isinstance(right, ast.Constant):
+                    continue
+                # Identity tests on purpose: 0 == False and 1 == True, so `in` would hide `x is 0`
+                singleton = right.value is None or right.value is Ellipsis or isinstance(right.value, bool)
+                if isinstance(op, (ast.Is, ast.IsNot)) and not singleton:
+                    diagnostics.append((node.lineno, node.col_offset, "is-literal",
+                                        "'is' compares identity; use '==' to compare with a literal"))
+                elif isinstance(op, (ast.Eq, ast.NotEq)) and right.value is None:
+                    diagnostics.append((node.lineno, node.col_offset, "none-equality",
+                                        "compare with None using 'is' / 'is not'"))
+
+        elif isinstance(node, ast.Assert) and isinstance(node.test, ast.Tuple) and node.test.elts:
+            diagnostics.append((node.lineno, node.col_offset, "assert-tuple",
+                                "assert on a non-empty tuple is always true"))
+
+        elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store) and node.id in SHADOWABLE_BUILTINS:
+            diagnostics.append((node.lineno, node.col_offset, "shadowed-builtin",
+                                f"assignment shadows the built-in '{node.id}'"))
+
+        for field in ("body", "orelse", "finalbody"):
+            block = getattr(node, field, None)
+            if not isinstance(block, list):
+                continue
+            for stmt, following in zip(block, block[1:]):
+                if isinstance(stmt, (ast.Return, ast.Raise, ast.Break, ast.Continue)):
+                    diagnostics.append((following.lineno, following.col_offset, "unreachable-code",
+                                        "statement can never run"))
+                    break
+    return diagnostics
+
+
+def _static_check(code) -> List[Diagnostic]:
+    """Run every static check; a syntax or parse error short-circuits the rest"""
+    try:
+        tree = ast.parse(code)
+    except SyntaxError as e:
+        return [(e.lineno or 0, (e.offset or 1) - 1, "syntax-error", e.msg)]
+    except (RecursionError, MemoryError, ValueError) as e:
+        # Valid but pathologically deep code, or source with null bytes
+        return [(0, 0, "parse-error", f"code could not be parsed: {type(e).__name__}")]
+    diagnostics = _check_names(tree) + _check_imports(tree) + _check_lint(tree)
+    return sorted(diagnostics)
+
+
+def check_python_code(code) -> Tuple[Diagnostic, ...]:
+    """Static diagnostics for ``code``, memoized by its SHA-256 digest.
+
+    Returns a tuple so callers cannot mutate the shared cached result.
+    """
+    digest = hashlib.sha256(code.encode("utf-8")).hexdigest()
+    with _check_cache_lock:
+        if digest in _check_cache:
+            _check_cache.move_to_end(digest)
+            return _check_cache[digest]
+
+    diagnostics = tuple(_static_check(code))
+    with _check_cache_lock:
+        _check_cache[digest] = diagnostics
+        if len(_check_cache) > CHECK_CACHE_SIZE:
+            _check_cache.popitem(last=False)
+    return diagnostics
+
+
+def _truncate(text):
+    """Keep sandbox output short enough to fit in an agent prompt"""
+    if len(text) <= SANDBOX_OUTPUT_CHARS:
+        return text
+    return text[:SANDBOX_OUTPUT_CHARS] + "\n... (truncated)"
+
+
+def _kill_group(proc):
+    """Kill the child and anything it started in its process group"""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _execute(code):
+    """Run a snippet in a resource-limited child interpreter in its own process group"""
+    with tempfile.TemporaryDirectory() as workdir:
+        proc = subprocess.Popen(
+            [sys.executable, "-I", "-c", SANDBOX_LAUNCHER,
+             str(SANDBOX_CPU_SECONDS), str(SANDBOX_MEMORY_BYTES)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            cwd=workdir,
+            env={
+                "PATH": os.environ.get("PATH", ""),
+                # Keep BLAS/OpenMP single-threaded; extra threads count against RLIMIT_NPROC
+                "OMP_NUM_THREADS": "1",
+                "OPENBLAS_NUM_THREADS": "1",
+                "MKL_NUM_THREADS": "1",
+            },
+            start_new_session=True,
+        )
+        try:
+            stdout, stderr = proc.communicate(code, timeout=SANDBOX_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            # Either the snippet is still running, or it exited and a background
+            # child it started is holding the output pipes open
+            finished = proc.poll() is not None
+            _kill_group(proc)
+            stdout, stderr = proc.communicate()
+            if not finished:
+                return f"Execution timed out after {SANDBOX_TIMEOUT}s."
+        finally:
+            # Reap background children the snippet left behind in its group
+            _kill_group(proc)
+
+    lines = [f"Exit code: {proc.returncode}"]
+    if proc.returncode < 0:
+        lines.append(f"Killed by signal {-proc.returncode} (CPU or memory limit exceeded).")
+    if stdout:
+        lines.append(f"stdout:\n{_truncate(stdout)}")
+    if stderr:
+        lines.append(f"stderr:\n{_truncate(stderr)}")
+    return "\n".join(lines)
+
+
+def run_in_sandbox(code):
+    """Execute ``code`` on the bounded sandbox pool and return a text report"""
+    if not SANDBOX_ENABLED:
+        return "Execution is disabled (set SKILLQUEST_SANDBOX_EXEC=1 to enable)."
+    if resource is None:
+        return "Execution is unavailable: resource limits are not supported on this platform."
+    return _sandbox_pool.submit(_execute, code).result()
+
+
+def format_report(diagnostics):
+    """Render diagnostics as one line per issue for the agent"""
+    if not diagnostics:
+        return "Static check: no issues found."
+    lines = [f"Static check: {len(diagnostics)} issue(s)"]
+    lines.extend(
+        f"- line {line}:{col} [{rule}] {message}"
+        for line, col, rule, message in diagnostics
+    )
+    return "\n".join(lines)
+
+
+class PythonCheckToolInput(BaseModel):
+    """Input schema for PythonCheckTool."""
+    code: str = Field(..., description="The complete Python source code to check.")
+    execute: bool = Field(
+        False,
+        description=(
+            "Also run the code in a resource-limited subprocess (CPU, memory, time) and report its "
+            "output; only if the code parses. This is not an isolation boundary."
+        )
+    )
+
+
+class PythonCheckTool(BaseTool):
+    name: str = "Python static checker"
     description: str = (
-        "Clear description for what this tool is useful for, your agent will need this information to use it."
+        "Checks Python code locally in milliseconds: syntax errors, undefined names, misspelled or unused "
+        "imports, and common bugs (mutable defaults, bare except, 'is' with literals, unreachable code, "
+        "shadowed built-ins). Use it on any code the user provides before reasoning about the bug."
     )
-    args_schema: Type[BaseModel] = MyCustomToolInput
+    args_schema: Type[BaseModel] = PythonCheckToolInput
 
-    def _run(self, argument: str) -> str:
-        # Implementation goes here
-        return "this is an example of a tool output, ignore it and move along."
+    def _run(self, code: str, execute: bool = False) -> str:
+        diagnostics = check_python_code(code)
+        report = format_report(diagnostics)
+        if execute and not any(rule in ("syntax-error", "parse-error") for _, _, rule, _ in diagnostics):
+            report += "\n\nExecution:\n" + run_in_sandbox(code)
+        return report
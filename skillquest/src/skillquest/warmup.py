@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Process-wide PathwayTutor and the warm-up bootstrap for workers.
+
+Heavy dependencies (crewai, litellm, langchain_core) are only imported when
+the tutor is first built, so importing app.py or main.py stays cheap. Call
+``warm_up()`` (or run this file) before a worker accepts traffic to pay that
+cost up front: it loads the config, pre-builds every agent and task, maps
+the precomputed FAQ store, and optionally sends one tiny completion so
+LiteLLM's provider modules and HTTP client are ready for the first real
+question.
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+from dotenv import load_dotenv
+
+_tutor = None
+_tutor_lock = threading.Lock()
+
+
+def configure_environment():
+    """Load .env so MODEL, GROQ_API_KEY and SKILLQUEST_* settings are visible"""
+    load_dotenv()
+
+
+def get_tutor():
+    """Return the process-wide PathwayTutor, building it on first use"""
+    global _tutor
+    if _tutor is None:
+        with _tutor_lock:
+            if _tutor is None:
+                # Deferred: importing crew pulls in crewai and litellm (several seconds)
+                import litellm
+                from crew import PathwayTutor
+
+                # Configure LiteLLM to drop unnecessary parameters
+                litellm.drop_params = True
+                _tutor = PathwayTutor()
+    return _tutor
+
+
+def prebuild(tutor):
+    """Instantiate every agent and task so the first request only copies them"""
+    for name in tutor.agents_yaml:
+        getattr(tutor, name)()
+    for method in (
+        tutor.categorize_question,
+        tutor.define_term,
+        tutor.explain_concept,
+        tutor.give_types_examples,
+        tutor.solve_problem,
+        tutor.compare_concepts,
+        tutor.guide_process,
+        tutor.clear_doubt,
+        tutor.provide_python_code,
+        tutor.debug_python_code,
+    ):
+        method()
+
+
+def warm_llm(tutor):
+    """Send a one-token completion through the shared LLM settings"""
+    import litellm
+
+    litellm.completion(
+        model=tutor.llm.model,
+        api_key=tutor.llm.api_key,
+        messages=[{"role": "user", "content": "ping"}],
+        max_tokens=1,
+    )
+
+
+def warm_up(ping_llm=True):
+    """Build and warm the tutor; returns the seconds spent in each phase"""
+    timings = {}
+
+    start = time.perf_counter()
+    configure_environment()
+    tutor = get_tutor()
+    timings["import_and_config"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    prebuild(tutor)
+    timings["prebuild_agents_tasks"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    from faq_store import get_faq_store
+
+    get_faq_store()  # maps the precomputed answers if they have been built
+    timings["faq_store"] = time.perf_counter() - start
+
+    if ping_llm:
+        start = time.perf_counter()
+        try:
+            warm_llm(tutor)
+        except Exception as e:
+            # A failed ping must not keep the worker from starting
+            print(f"⚠️ LLM warm-up failed: {e}")
+        timings["llm_ping"] = time.perf_counter() - start
+
+    return timings
+
+
+def main(argv=None):
+    """Warm this process, print the timings, and optionally serve the Streamlit app"""
+    parser = argparse.ArgumentParser(description="Warm a SkillQuest worker before it accepts traffic")
+    parser.add_argument("--no-ping", action="store_true", help="skip the one-token LLM warm-up call")
+    parser.add_argument("--serve", action="store_true", help="then run the Streamlit app in this process")
+    args = parser.parse_args(argv)
+
+    timings = warm_up(ping_llm=not args.no_ping)
+    for phase, seconds in timings.items():
+        print(f"{phase:<24}{seconds * 1000:>10.1f} ms")
+
+    if args.serve:
+        # Run Streamlit in this process so the warmed modules and tutor are reused
+        from streamlit.web import cli as stcli
+
+        app_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+        sys.argv = ["streamlit", "run", app_path]
+        sys.exit(stcli.main())
+
+
+if __name__ == "__main__":
+    # Re-import by name so app.py shares this module (and its tutor) when serving
+    import warmup
+
+    warmup.main()
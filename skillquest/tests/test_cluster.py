@@ -0,0 +1,160 @@
+import pytest
+
+import cluster
+import shared_cache
+from cluster import Supervisor, Worker, session_from_headers
+from shared_cache import SharedCache
+
+
+class FakeProcess:
+    def __init__(self, returncode=None):
+        self.returncode = returncode
+        self.pid = 1234
+
+    def poll(self):
+        return self.returncode
+
+
+def make_worker(index, alive=True, healthy=True):
+    worker = Worker(index, 9000 + index, env={}, ping_llm=False)
+    worker.process = FakeProcess(None if alive else 1)
+    worker.started = 0
+    worker.healthy = healthy
+    return worker
+
+
+@pytest.fixture
+def supervisor(tmp_path):
+    workers = [make_worker(i) for i in range(4)]
+    return Supervisor(workers, SharedCache(str(tmp_path / "cache.sqlite3")))
+
+
+@pytest.mark.parametrize("headers, expected", [
+    (["Host: x", "Cookie: sq_session=abc"], "abc"),
+    (["cookie: theme=dark; sq_session=abc; other=1"], "abc"),
+    (["Cookie: sq_session="], None),
+    (["Cookie: not_sq_session=abc"], None),
+    (["Host: x"], None),
+])
+def test_session_from_headers(headers, expected):
+    assert session_from_headers(headers) == expected
+
+
+def test_pick_is_stable_per_session(supervisor):
+    assert all(supervisor.pick("abc") is supervisor.pick("abc") for _ in range(10))
+
+
+def test_pick_spreads_sessions(supervisor):
+    picked = {supervisor.pick(f"session-{i}").index for i in range(200)}
+    assert picked == {0, 1, 2, 3}
+
+
+def test_single_failed_probe_keeps_sessions_on_a_live_worker(supervisor):
+    before = {f"s{i}": supervisor.pick(f"s{i}").index for i in range(200)}
+    for _ in range(cluster.MAX_FAILED_PROBES - 1):
+        supervisor.record_probe(supervisor.workers[2], False)
+    assert {session: supervisor.pick(session).index for session in before} == before
+    supervisor.record_probe(supervisor.workers[2], True)
+    assert supervisor.workers[2].failed_probes == 0
+
+
+def test_pick_only_moves_sessions_of_an_unhealthy_worker(supervisor):
+    before = {f"s{i}": supervisor.pick(f"s{i}").index for i in range(200)}
+    for _ in range(cluster.MAX_FAILED_PROBES):
+        supervisor.record_probe(supervisor.workers[2], False)
+    after = {session: supervisor.pick(session).index for session in before}
+    for session, index in before.items():
+        if index != 2:
+            assert after[session] == index
+        else:
+            assert after[session] != 2
+
+
+def test_exited_worker_loses_its_sessions_immediately(supervisor):
+    worker = supervisor.workers[2]
+    session = next(f"s{i}" for i in range(200) if supervisor.pick(f"s{i}") is worker)
+    worker.process = FakeProcess(1)
+    supervisor.record_probe(worker, False)
+    assert not worker.healthy
+    assert supervisor.pick(session) is not worker
+
+
+def test_restarted_worker_waits_for_its_first_good_probe(supervisor, monkeypatch):
+    monkeypatch.setattr(cluster.subprocess, "Popen", lambda *args, **kwargs: FakeProcess())
+    worker = supervisor.workers[0]
+    worker.start()
+    assert all(supervisor.pick(f"s{i}") is not worker for i in range(200))
+    supervisor.record_probe(worker, True)
+    assert any(supervisor.pick(f"s{i}") is worker for i in range(200))
+
+
+def test_pick_without_healthy_workers(supervisor):
+    for worker in supervisor.workers:
+        worker.process = FakeProcess(1)
+    assert supervisor.pick("abc") is None
+
+
+def test_crash_loop_backs_off_then_fails(supervisor, monkeypatch):
+    worker = supervisor.workers[0]
+    starts = []
+
+    def fake_start():
+        starts.append(now)
+        worker.process = FakeProcess(1)  # dies immediately again
+        worker.started = now
+
+    monkeypatch.setattr(worker, "start", fake_start)
+    worker.process = FakeProcess(1)
+
+    now = 0
+    delays = []
+    while not worker.failed and now < 10_000:
+        supervisor.supervise(worker, now)
+        if worker.next_start is not None and (not delays or delays[-1][0] != worker.quick_exits):
+            delays.append((worker.quick_exits, worker.next_start - now))
+        now += 1
+
+    assert [delay for _, delay in delays] == [2, 4, 8, 16]
+    assert worker.failed
+    assert len(starts) == cluster.MAX_QUICK_RESTARTS - 1
+    assert supervisor.report()["workers"][0]["failed"] is True
+
+
+def test_long_running_worker_restarts_after_base_delay(supervisor):
+    worker = supervisor.workers[1]
+    worker.process = FakeProcess(1)
+    worker.quick_exits = 3
+    supervisor.supervise(worker, cluster.QUICK_EXIT_SECONDS + 1)
+    assert worker.quick_exits == 0
+    assert worker.next_start == cluster.QUICK_EXIT_SECONDS + 1 + cluster.BACKOFF_BASE
+
+
+def test_worker_stats_can_be_reset(tmp_path):
+    cache = SharedCache(str(tmp_path / "cache.sqlite3"))
+    cache.record_request(worker="0")
+    assert cache.worker_stats()["0"]["requests"] == 1
+    cache.reset_worker_stats()
+    assert cache.worker_stats() == {}
+
+
+def test_category_cache_is_keyed_on_history(tmp_path):
+    cache = SharedCache(str(tmp_path / "cache.sqlite3"))
+    cache.set_category("show me the code for it", "Q: what is k-means", "Python-Code")
+    assert cache.get_category("Show me the code for it?", "Q: what is k-means") == "Python-Code"
+    assert cache.get_category("show me the code for it", "") is None
+
+
+def test_shared_cache_settings_are_read_at_call_time(tmp_path, monkeypatch):
+    monkeypatch.setattr(shared_cache, "_cache", None)
+    monkeypatch.delenv("SKILLQUEST_SHARED_CACHE", raising=False)
+    assert shared_cache.get_shared_cache() is None
+
+    # As if load_dotenv() ran after shared_cache was imported
+    monkeypatch.setenv("SKILLQUEST_SHARED_CACHE", str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setenv("SKILLQUEST_CACHE_TTL", "60")
+    monkeypatch.setenv("SKILLQUEST_WORKER_ID", "7")
+    cache = shared_cache.get_shared_cache()
+    assert cache.path == str(tmp_path / "cache.sqlite3")
+    assert cache.ttl == 60
+    cache.record_request()
+    assert cache.worker_stats()["7"]["requests"] == 1
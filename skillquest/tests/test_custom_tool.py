@@ -0,0 +1,82 @@
+import pytest
+
+from tools.custom_tool import check_python_code, format_report
+
+
+def rules(code):
+    return [rule for _, _, rule, _ in check_python_code(code)]
+
+
+@pytest.mark.parametrize("code, rule", [
+    ("print(pritn)", "undefined-name"),
+    ("import os", "unused-import"),
+    ("import pnadas\npnadas.read_csv('x')", "module-typo"),
+    ("def f(acc=[]):\n    return acc", "mutable-default"),
+    ("try:\n    pass\nexcept:\n    pass", "bare-except"),
+    ("x = 1\nx is 'a'", "is-literal"),
+    ("x = 1\nx is 1", "is-literal"),
+    ("x = 1\nx is 0", "is-literal"),
+    ("x = 1\nx == None", "none-equality"),
+    ("assert (1 > 2, 'msg')", "assert-tuple"),
+    ("list = [1]", "shadowed-builtin"),
+    ("def f():\n    return 1\n    print('never')", "unreachable-code"),
+])
+def test_rule_is_reported(code, rule):
+    assert rule in rules(code)
+
+
+@pytest.mark.parametrize("code", [
+    "try:\n    pass\nexcept ValueError:\n    raise\n    x = 1",
+    "for i in range(3):\n    pass\nelse:\n    x = 1\n    raise SystemExit\n    x = 2",
+    "try:\n    pass\nfinally:\n    raise SystemExit\n    x = 1",
+])
+def test_unreachable_code_in_handlers_orelse_and_finally(code):
+    assert "unreachable-code" in rules(code)
+
+
+def test_clean_data_science_code_has_no_issues():
+    code = (
+        "import pandas as pd\n"
+        "from sklearn.model_selection import train_test_split\n"
+        "df = pd.read_csv('data.csv')\n"
+        "train, test = train_test_split(df)\n"
+    )
+    assert check_python_code(code) == ()
+
+
+def test_unknown_but_plausible_package_is_not_reported():
+    assert rules("import some_inhouse_lib\nsome_inhouse_lib.run()") == []
+
+
+@pytest.mark.parametrize("module", ["config", "tensorflow_hub", "pandas_ta", "models"])
+def test_names_extending_or_inside_known_modules_are_not_typos(module):
+    assert rules(f"import {module}\n{module}.run()") == []
+
+
+def test_singleton_identity_checks_are_not_reported():
+    assert rules("x = 1\nx is None\nx is True\nx is not False\nx is ...") == []
+
+
+def test_syntax_error_short_circuits_other_checks():
+    assert rules("import os\ndef f(:\n    pass") == ["syntax-error"]
+
+
+def test_pathologically_deep_code_is_a_parse_error():
+    code = "x = " + "+".join(["a"] * 200000)
+    assert rules(code) == ["parse-error"]
+
+
+def test_results_are_memoized_by_code():
+    code = "print(undefined_thing)"
+    first = check_python_code(code)
+    assert isinstance(first, tuple)
+    assert check_python_code(code) is first
+
+
+def test_format_report():
+    assert format_report([]) == "Static check: no issues found."
+    report = format_report([(3, 4, "undefined-name", "'x' is not defined")])
+    assert report.splitlines() == [
+        "Static check: 1 issue(s)",
+        "- line 3:4 [undefined-name] 'x' is not defined",
+    ]
@@ -0,0 +1,75 @@
+import pytest
+
+import faq_store
+from faq_store import FAQStore, get_faq_store, normalize_question, write_store
+
+
+@pytest.fixture
+def store(tmp_path):
+    path = tmp_path / "faq.bin"
+    entries = [
+        ("What is overfitting?", "Definition-Based", "# Overfitting\nfits noise"),
+        ("Difference between L1 and L2 regularization", "Comparison", "L1 is sparse\0L2 is smooth"),
+    ]
+    entries += [(f"synthetic question {i}", "Doubt-Clearing", f"answer {i}") for i in range(500)]
+    write_store(entries, path)
+    faq = FAQStore(path)
+    yield faq, entries
+    faq.close()
+
+
+def test_every_entry_round_trips(store):
+    faq, entries = store
+    assert len(faq) == len(entries)
+    for question, category, answer in entries:
+        assert faq.lookup(question) == (answer, category)
+
+
+def test_lookup_ignores_case_and_punctuation(store):
+    faq, _ = store
+    assert faq.lookup("  what is OVERFITTING ") == ("# Overfitting\nfits noise", "Definition-Based")
+
+
+def test_unknown_question_misses(store):
+    faq, _ = store
+    assert faq.lookup("What is underfitting?") is None
+
+
+def test_empty_store(tmp_path):
+    path = tmp_path / "faq.bin"
+    assert write_store([], path) == 0
+    assert FAQStore(path).lookup("anything") is None
+
+
+def test_normalize_question_keeps_language_names():
+    assert normalize_question("C++ vs. C#?") == "c++ vs c#"
+
+
+@pytest.mark.parametrize("content", [b"", b"not a store", b"SQFAQ001" + b"\xff" * 12])
+def test_invalid_file_is_rejected(tmp_path, content):
+    path = tmp_path / "faq.bin"
+    path.write_bytes(content)
+    with pytest.raises(ValueError):
+        FAQStore(path)
+
+
+def test_get_faq_store_falls_back_once_on_a_broken_file(tmp_path, monkeypatch, capsys):
+    path = tmp_path / "faq.bin"
+    path.write_bytes(b"")
+    monkeypatch.setenv("SKILLQUEST_FAQ_PATH", str(path))
+    monkeypatch.setattr(faq_store, "_store", None)
+    monkeypatch.setattr(faq_store, "_store_failed", False)
+
+    assert get_faq_store() is None
+    assert get_faq_store() is None
+    assert capsys.readouterr().out.count("Ignoring FAQ store") == 1
+
+
+def test_get_faq_store_reads_path_at_call_time(tmp_path, monkeypatch):
+    path = tmp_path / "custom.bin"
+    write_store([("What is a tensor?", "Definition-Based", "an n-d array")], path)
+    monkeypatch.setenv("SKILLQUEST_FAQ_PATH", str(path))
+    monkeypatch.setattr(faq_store, "_store", None)
+    monkeypatch.setattr(faq_store, "_store_failed", False)
+
+    assert get_faq_store().lookup("what is a tensor") == ("an n-d array", "Definition-Based")